@@ -1,9 +1,12 @@
 """Go board representation and game logic."""
 
-from typing import Optional, Set, Tuple, List
+from typing import FrozenSet, Iterator, Optional, Set, Tuple, List
 from enum import Enum
 from dataclasses import dataclass
+import array
+import base64
 import json
+import random
 
 
 class Stone(Enum):
@@ -14,11 +17,7 @@ class Stone(Enum):
 
     def opposite(self) -> 'Stone':
         """Return the opposite color stone."""
-        if self == Stone.BLACK:
-            return Stone.WHITE
-        elif self == Stone.WHITE:
-            return Stone.BLACK
-        return Stone.EMPTY
+        return Stone(_OPPOSITE_INT[self.value])
 
     def __str__(self) -> str:
         """String representation for display."""
@@ -29,27 +28,51 @@ class Stone(Enum):
         return '·'
 
 
-@dataclass
+# Raw stone values for the hot paths, which compare bytes from the board
+# buffer directly rather than going through Enum dispatch. Note that the
+# opposite of a color is simply 3 - color for these values.
+_EMPTY = Stone.EMPTY.value
+_BLACK = Stone.BLACK.value
+_WHITE = Stone.WHITE.value
+
+# Opposite color indexed by raw value: EMPTY maps to itself, and hot code
+# can flip a color with one tuple index instead of branching.
+_OPPOSITE_INT = (_EMPTY, _WHITE, _BLACK)
+
+# Coordinate lookup tables. SGF uses letters a-s; the human notation skips
+# 'I', so column 8 is 'J'. Bulk SGF import/export converts through these
+# instead of repeated chr/ord arithmetic.
+_SGF_CHARS = 'abcdefghijklmnopqrs'
+_SGF_INDEX = {c: i for i, c in enumerate(_SGF_CHARS)}
+_HUMAN_COLS = 'ABCDEFGHJKLMNOPQRST'
+_HUMAN_COL_INDEX = {c: i for i, c in enumerate(_HUMAN_COLS)}
+
+
+@dataclass(frozen=True)
 class Move:
     """Represents a move in the game."""
+    # Slots spelled out by hand (rather than dataclass(slots=True)) to keep
+    # Python 3.9 support; drops the per-instance __dict__, which matters for
+    # long correspondence histories. Frozen makes moves hashable cache keys.
+    __slots__ = ('x', 'y', 'color')
     x: int
     y: int
     color: Stone
 
     def to_sgf_coords(self, board_size: int) -> str:
         """Convert to SGF coordinate format (aa to ss)."""
-        # SGF uses letters a-s for coordinates
-        x_char = chr(ord('a') + self.x)
-        y_char = chr(ord('a') + self.y)
-        return f"{x_char}{y_char}"
+        return _SGF_CHARS[self.x] + _SGF_CHARS[self.y]
 
     @classmethod
     def from_sgf_coords(cls, coords: str, color: Stone) -> 'Move':
         """Create a Move from SGF coordinate format."""
         if len(coords) != 2:
             raise ValueError(f"Invalid SGF coordinates: {coords}")
-        x = ord(coords[0]) - ord('a')
-        y = ord(coords[1]) - ord('a')
+        try:
+            x = _SGF_INDEX[coords[0]]
+            y = _SGF_INDEX[coords[1]]
+        except KeyError:
+            raise ValueError(f"Invalid SGF coordinates: {coords}") from None
         return cls(x, y, color)
 
     @classmethod
@@ -62,29 +85,130 @@ class Move:
         if col_char == 'I':
             raise ValueError("'I' is not used in Go coordinates (use A-H, J-T)")
 
-        # Adjust for skipped 'I' - J and beyond need to be shifted down by 1
-        if col_char >= 'J':
-            col = ord(col_char) - ord('A') - 1
-        else:
-            col = ord(col_char) - ord('A')
+        col = _HUMAN_COL_INDEX.get(col_char)
+        if col is None:
+            raise ValueError(f"Invalid column in coordinates: {coords}")
 
         row = int(coords[1:]) - 1
         return cls(col, row, color)
 
     def to_human_coords(self) -> str:
         """Convert to human-readable coordinates."""
-        # Skip 'I' in Go coordinates
-        if self.x < 8:
-            col = chr(ord('A') + self.x)
-        else:
-            col = chr(ord('A') + self.x + 1)  # Skip 'I'
-        row = str(self.y + 1)
-        return f"{col}{row}"
+        return f"{_HUMAN_COLS[self.x]}{self.y + 1}"
+
+
+def _build_neighbor_table(size: int) -> List[Tuple[int, ...]]:
+    """Build a table mapping each flat index to its in-bounds neighbor indices."""
+    table = []
+    for idx in range(size * size):
+        x, y = idx % size, idx // size
+        neighbors = []
+        if x > 0:
+            neighbors.append(idx - 1)
+        if x < size - 1:
+            neighbors.append(idx + 1)
+        if y > 0:
+            neighbors.append(idx - size)
+        if y < size - 1:
+            neighbors.append(idx + size)
+        table.append(tuple(neighbors))
+    return table
+
+
+# Neighbor tables are immutable and shared by every board of the same size.
+_NEIGHBOR_TABLES: dict = {}
+
+
+def _build_zobrist_table(size: int) -> List[Tuple[int, int]]:
+    """Build the per-cell (black, white) Zobrist keys for a board size.
+
+    Seeded deterministically so hashes are stable across processes.
+    """
+    rng = random.Random(0x60B0A12D ^ size)
+    return [(rng.getrandbits(64), rng.getrandbits(64))
+            for _ in range(size * size)]
+
+
+def _flood_group(buf: bytearray, neighbors: List[Tuple[int, ...]],
+                 idx: int, visited: bytearray, stack: List[int]) -> List[int]:
+    """Collect the flat indices of the group containing the stone at `idx`.
+
+    A free function over the raw buffer and neighbor table so the flood
+    fill runs without per-step attribute lookups on the board object.
+    `visited` is a zeroed size*size scratch bytearray and `stack` a
+    preallocated index stack; marking cells at push time means each cell
+    is visited exactly once, with no set hashing or list growth. The
+    visited buffer is zeroed again before returning.
+    """
+    color = buf[idx]
+    group: List[int] = []
+    stack[0] = idx
+    top = 1
+    visited[idx] = 1
+
+    while top:
+        top -= 1
+        i = stack[top]
+        group.append(i)
+
+        for n in neighbors[i]:
+            if buf[n] == color and not visited[n]:
+                visited[n] = 1
+                stack[top] = n
+                top += 1
+
+    for i in group:
+        visited[i] = 0
+    return group
+
+
+# Zobrist key tables, shared per size like the neighbor tables.
+_ZOBRIST_TABLES: dict = {}
+
+# Bound on the per-board cache of legal-move sets.
+_LEGAL_CACHE_LIMIT = 64
+
+def _build_ascii_frame(size: int):
+    """Build the static coordinate frame of an ASCII render.
+
+    The column header, row labels and per-row buffer offsets depend only
+    on the board size, so they are rendered once per size and shared by
+    every board.
+    """
+    col_labels = "   " + " ".join(_HUMAN_COLS[:size])
+    row_prefixes = [f"{size - y:2} " for y in range(size)]
+    row_suffixes = [f"{size - y:2}" for y in range(size)]
+    # Flat index of each display row's first cell (display flips Y)
+    row_bases = [(size - 1 - y) * size for y in range(size)]
+    return col_labels, row_prefixes, row_suffixes, row_bases
+
+
+# Memoized coordinate frames, keyed by board size.
+_ASCII_FRAMES: dict = {}
+
+# Bound on the per-board cache of rendered ASCII boards; the same
+# position is often rendered more than once (e.g. move --show then show).
+_ASCII_CACHE_LIMIT = 8
+
+# Bound on the undo snapshot stack; undos past this fall back to replay.
+_SNAPSHOT_LIMIT = 512
+
+# A rewind keyframe is recorded every this many moves, so reconstructing
+# an old position replays at most this many moves from the nearest frame.
+_KEYFRAME_INTERVAL = 16
 
 
 class GoBoard:
     """Represents a Go board and handles game logic."""
 
+    # Star point (hoshi) positions per board size
+    _STAR_POINTS = {
+        9: frozenset([(2, 2), (6, 2), (4, 4), (2, 6), (6, 6)]),
+        13: frozenset([(3, 3), (9, 3), (6, 6), (3, 9), (9, 9)]),
+        19: frozenset([(3, 3), (9, 3), (15, 3), (3, 9), (9, 9), (15, 9),
+                       (3, 15), (9, 15), (15, 15)]),
+    }
+
     def __init__(self, size: int = 19):
         """Initialize a Go board.
 
@@ -95,94 +219,253 @@ class GoBoard:
             raise ValueError(f"Board size must be 9, 13, or 19, got {size}")
 
         self.size = size
-        self.board = [[Stone.EMPTY for _ in range(size)] for _ in range(size)]
+        self._stride = size
+        # Flat row-major buffer of Stone values (0/1/2); position (x, y) lives
+        # at index y * size + x. A single bytearray keeps the whole board in
+        # one contiguous, cache-friendly allocation.
+        self.board = bytearray(size * size)
+        if size not in _NEIGHBOR_TABLES:
+            _NEIGHBOR_TABLES[size] = _build_neighbor_table(size)
+        self._neighbors = _NEIGHBOR_TABLES[size]
+        # Reusable range objects for the per-row and per-cell loops
+        self._rng = range(size)
+        self._flat_rng = range(size * size)
+        self._star_set = self._STAR_POINTS.get(size, frozenset())
+        # Flat mask of star points, so renderers can test cells by index
+        self._star_mask = bytearray(size * size)
+        for sx, sy in self._star_set:
+            self._star_mask[sy * size + sx] = 1
         self.captured_black = 0
         self.captured_white = 0
         self.move_history: List[Move] = []
         self.ko_point: Optional[Tuple[int, int]] = None
 
+        # Incremental group bookkeeping: a union-find over flat indices with,
+        # per root, the group's member indices and its set of liberty indices.
+        # Kept in sync by place_stone so legality and capture checks only
+        # inspect the played point's four neighbors instead of flood-filling.
+        self._parent: List[int] = list(range(size * size))
+        self._members: dict = {}
+        self._liberties: dict = {}
+        # Empty points, kept in step with placements and captures so move
+        # enumeration never scans occupied cells
+        self._empties: Set[int] = set(range(size * size))
+
+        # Scratch buffers reused by every flood fill on this board
+        self._visit_buf = bytearray(size * size)
+        self._flood_stack: List[int] = [0] * (size * size)
+
+        # Pre-move snapshots (board bytes, captures, ko point) pushed by
+        # place_stone so undo is a restore instead of a full replay
+        self._history_states: List[Tuple[bytes, int, int,
+                                         Optional[Tuple[int, int]]]] = []
+
+        # Periodic post-move keyframes (move index, board bytes, captures,
+        # ko point), persisted with the game so old positions can be
+        # reconstructed without replaying from move zero
+        self._keyframes: List[Tuple[int, bytes, int, int,
+                                    Optional[Tuple[int, int]]]] = []
+
+        # Incrementally maintained Zobrist hash of the stone configuration,
+        # used to key caches of position-dependent results.
+        if size not in _ZOBRIST_TABLES:
+            _ZOBRIST_TABLES[size] = _build_zobrist_table(size)
+        self._z_table = _ZOBRIST_TABLES[size]
+        self._zobrist = 0
+        self._legal_cache: dict = {}
+        self._ascii_cache: dict = {}
+
     def get(self, x: int, y: int) -> Stone:
         """Get the stone at position (x, y)."""
-        if not self._is_valid_position(x, y):
+        size = self.size
+        if not (0 <= x < size and 0 <= y < size):
             raise ValueError(f"Position ({x}, {y}) is out of bounds")
-        return self.board[y][x]
+        return Stone(self.board[y * size + x])
 
     def set(self, x: int, y: int, stone: Stone) -> None:
-        """Set a stone at position (x, y)."""
-        if not self._is_valid_position(x, y):
+        """Set a stone at position (x, y).
+
+        This is a low-level editing hook that bypasses the rules; the group
+        bookkeeping is rebuilt from the buffer afterwards.
+        """
+        size = self.size
+        if not (0 <= x < size and 0 <= y < size):
             raise ValueError(f"Position ({x}, {y}) is out of bounds")
-        self.board[y][x] = stone
+        self.board[y * size + x] = stone.value
+        self._rebuild_groups()
+
+    def iter_stones(self) -> Iterator[Tuple[int, int, Stone]]:
+        """Yield (x, y, stone) for every occupied point.
+
+        Sparse iteration for renderers and exporters: walks the flat
+        buffer once and skips empty cells, so early-game consumers touch
+        a handful of points instead of all size**2 of them.
+        """
+        size = self.size
+        for idx, value in enumerate(self.board):
+            if value:
+                yield idx % size, idx // size, Stone(value)
 
     def _is_valid_position(self, x: int, y: int) -> bool:
         """Check if a position is within board bounds."""
         return 0 <= x < self.size and 0 <= y < self.size
 
-    def _get_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
-        """Get valid neighboring positions."""
-        neighbors = []
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            nx, ny = x + dx, y + dy
-            if self._is_valid_position(nx, ny):
-                neighbors.append((nx, ny))
-        return neighbors
-
-    def _get_group(self, x: int, y: int) -> Set[Tuple[int, int]]:
-        """Get all stones in the same group as the stone at (x, y)."""
-        if self.get(x, y) == Stone.EMPTY:
-            return set()
-
-        color = self.get(x, y)
-        group = set()
-        to_check = [(x, y)]
-
-        while to_check:
-            cx, cy = to_check.pop()
-            if (cx, cy) in group:
-                continue
-            group.add((cx, cy))
+    def _get_neighbors(self, idx: int) -> Tuple[int, ...]:
+        """Get the in-bounds neighbor indices of a flat board index."""
+        return self._neighbors[idx]
 
-            for nx, ny in self._get_neighbors(cx, cy):
-                if self.get(nx, ny) == color and (nx, ny) not in group:
-                    to_check.append((nx, ny))
+    def _get_group(self, idx: int) -> List[int]:
+        """Get the flat indices of all stones in the same group as `idx`."""
+        if self.board[idx] == _EMPTY:
+            return []
+        return _flood_group(self.board, self._neighbors, idx,
+                            self._visit_buf, self._flood_stack)
 
-        return group
-
-    def _has_liberties(self, group: Set[Tuple[int, int]]) -> bool:
+    def _has_liberties(self, group: List[int]) -> bool:
         """Check if a group has any liberties."""
-        for x, y in group:
-            for nx, ny in self._get_neighbors(x, y):
-                if self.get(nx, ny) == Stone.EMPTY:
+        buf = self.board
+        neighbors = self._neighbors
+        for i in group:
+            for n in neighbors[i]:
+                if buf[n] == _EMPTY:
                     return True
         return False
 
-    def _remove_group(self, group: Set[Tuple[int, int]]) -> int:
-        """Remove a group of stones from the board."""
-        if not group:
-            return 0
-
-        # Determine color being captured
-        sample_x, sample_y = next(iter(group))
-        color = self.get(sample_x, sample_y)
-
-        # Remove stones
-        for x, y in group:
-            self.set(x, y, Stone.EMPTY)
-
-        return len(group)
-
-    def _capture_stones(self, x: int, y: int, color: Stone) -> int:
-        """Capture enemy stones around the given position."""
+    def _find(self, i: int) -> int:
+        """Find the root of the group containing flat index `i`."""
+        parent = self._parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def _union(self, a: int, b: int) -> int:
+        """Merge the groups rooted at `a` and `b`; return the surviving root."""
+        if a == b:
+            return a
+        # Union by size: fold the smaller group into the larger one
+        if len(self._members[a]) < len(self._members[b]):
+            a, b = b, a
+        parent = self._parent
+        for i in self._members[b]:
+            parent[i] = a
+        self._members[a].extend(self._members.pop(b))
+        self._liberties[a] |= self._liberties.pop(b)
+        return a
+
+    def _place(self, idx: int, color: Stone) -> int:
+        """Place a validated stone at `idx`, updating the group bookkeeping.
+
+        Returns the number of enemy stones captured.
+        """
+        buf = self.board
+        color_value = color.value
+        find = self._find
+        liberties = self._liberties
+
+        # Classify the four neighbors before the stone goes down
+        libs = set()
+        friendly_roots = set()
+        enemy_roots = set()
+        for n in self._neighbors[idx]:
+            v = buf[n]
+            if v == _EMPTY:
+                libs.add(n)
+            elif v == color_value:
+                friendly_roots.add(find(n))
+            else:
+                enemy_roots.add(find(n))
+
+        # The stone starts as its own single-member group
+        buf[idx] = color_value
+        self._empties.discard(idx)
+        self._zobrist ^= self._z_table[idx][color_value - 1]
+        self._parent[idx] = idx
+        self._members[idx] = [idx]
+        liberties[idx] = libs
+
+        # The played point is no longer a liberty of any adjacent group
+        for r in friendly_roots:
+            liberties[r].discard(idx)
+        for r in enemy_roots:
+            liberties[r].discard(idx)
+
+        # Join up with friendly neighbors
+        root = idx
+        for r in friendly_roots:
+            root = self._union(root, r)
+
+        # Capture enemy groups left without liberties
         captured = 0
-        enemy_color = color.opposite()
-
-        for nx, ny in self._get_neighbors(x, y):
-            if self.get(nx, ny) == enemy_color:
-                group = self._get_group(nx, ny)
-                if not self._has_liberties(group):
-                    captured += self._remove_group(group)
+        for r in enemy_roots:
+            if not liberties[r]:
+                captured += self._capture_group(r)
 
         return captured
 
+    def _capture_group(self, root: int) -> int:
+        """Remove the group rooted at `root`; return the number of stones."""
+        members = self._members.pop(root)
+        del self._liberties[root]
+        buf = self.board
+        z_table = self._z_table
+        color_value = buf[members[0]]
+        empties = self._empties
+        zobrist = self._zobrist
+        for i in members:
+            buf[i] = 0
+            empties.add(i)
+            zobrist ^= z_table[i][color_value - 1]
+        self._zobrist = zobrist
+
+        # Each cleared cell becomes a liberty of the groups still around it
+        find = self._find
+        neighbors = self._neighbors
+        liberties = self._liberties
+        for i in members:
+            for n in neighbors[i]:
+                if buf[n] != _EMPTY:
+                    liberties[find(n)].add(i)
+
+        return len(members)
+
+    def _rebuild_groups(self) -> None:
+        """Rebuild the group bookkeeping from the raw board buffer."""
+        self._parent = list(self._flat_rng)
+        self._members = {}
+        self._liberties = {}
+
+        buf = self.board
+        z_table = self._z_table
+        zobrist = 0
+        empties = set()
+        for idx in self._flat_rng:
+            if buf[idx]:
+                zobrist ^= z_table[idx][buf[idx] - 1]
+            else:
+                empties.add(idx)
+        self._zobrist = zobrist
+        self._empties = empties
+
+        seen: Set[int] = set()
+        for idx in self._flat_rng:
+            if buf[idx] == _EMPTY or idx in seen:
+                continue
+            group = self._get_group(idx)
+            seen.update(group)
+            for i in group:
+                self._parent[i] = idx
+            self._members[idx] = group
+            libs = set()
+            for i in group:
+                for nb in self._neighbors[i]:
+                    if buf[nb] == _EMPTY:
+                        libs.add(nb)
+            self._liberties[idx] = libs
+
     def is_valid_move(self, x: int, y: int, color: Stone) -> tuple[bool, str]:
         """Check if a move is valid.
 
@@ -202,27 +485,66 @@ class GoBoard:
         if self.ko_point == (x, y):
             return False, "Move violates ko rule (immediate recapture)"
 
-        # Save board state
-        saved_board = [row[:] for row in self.board]
-
-        # Temporarily place the stone
-        self.set(x, y, color)
-
-        # Check for captures
-        captured = self._capture_stones(x, y, color)
-
-        # Check for suicide (placing a stone with no liberties and no captures)
-        own_group = self._get_group(x, y)
-        is_suicide = not self._has_liberties(own_group) and captured == 0
-
-        # Restore the board completely
-        self.board = saved_board
+        # The move is legal if the stone gets a liberty from an empty
+        # neighbor, joins a friendly group with a spare liberty, or captures
+        # an adjacent enemy group whose last liberty is this point. All of
+        # these read the maintained liberty sets - no board mutation needed.
+        idx = y * self._stride + x
+        buf = self.board
+        color_value = color.value
+        liberties = self._liberties
+        find = self._find
+
+        is_suicide = True
+        for n in self._neighbors[idx]:
+            v = buf[n]
+            if v == _EMPTY:
+                is_suicide = False
+                break
+            group_libs = liberties[find(n)]
+            if v == color_value:
+                if len(group_libs) > 1:
+                    is_suicide = False
+                    break
+            elif len(group_libs) == 1:
+                # The enemy group's only liberty is (x, y): playing captures it
+                is_suicide = False
+                break
 
         if is_suicide:
             return False, "Suicide move (stone/group would have no liberties)"
 
         return True, ""
 
+    @property
+    def next_color(self) -> Stone:
+        """The color to move, assuming alternating play starting with black."""
+        return Stone.WHITE if len(self.move_history) & 1 else Stone.BLACK
+
+    def legal_moves(self, color: Stone) -> FrozenSet[Tuple[int, int]]:
+        """Get all legal move positions for `color` as a set of (x, y) pairs.
+
+        Results are cached per position (Zobrist hash + ko point), so
+        repeated queries against an unchanged board are O(1).
+        """
+        key = (self._zobrist, self.ko_point, color.value)
+        cached = self._legal_cache.get(key)
+        if cached is not None:
+            return cached
+
+        size = self.size
+        moves = []
+        for idx in self._empties:
+            x, y = idx % size, idx // size
+            if self.is_valid_move(x, y, color)[0]:
+                moves.append((x, y))
+
+        result = frozenset(moves)
+        if len(self._legal_cache) >= _LEGAL_CACHE_LIMIT:
+            self._legal_cache.clear()
+        self._legal_cache[key] = result
+        return result
+
     def place_stone(self, x: int, y: int, color: Stone) -> tuple[bool, str]:
         """Place a stone on the board.
 
@@ -233,11 +555,15 @@ class GoBoard:
         if not is_valid:
             return False, error_msg
 
-        # Place the stone
-        self.set(x, y, color)
+        # Snapshot the pre-move state for undo
+        self._history_states.append((bytes(self.board), self.captured_black,
+                                     self.captured_white, self.ko_point))
+        if len(self._history_states) > _SNAPSHOT_LIMIT:
+            del self._history_states[0]
 
-        # Capture enemy stones
-        captured = self._capture_stones(x, y, color)
+        # Place the stone and capture enemy stones
+        idx = y * self._stride + x
+        captured = self._place(idx, color)
 
         # Update captured counts
         if color == Stone.BLACK:
@@ -251,31 +577,48 @@ class GoBoard:
         self.ko_point = None
         if captured == 1:
             # Find the captured position
-            for nx, ny in self._get_neighbors(x, y):
-                if self.get(nx, ny) == Stone.EMPTY:
+            enemy_value = _OPPOSITE_INT[color.value]
+            for n in self._neighbors[idx]:
+                if self.board[n] == _EMPTY:
                     # Check if this was just captured
-                    temp_board = [row[:] for row in self.board]
-                    self.set(nx, ny, color.opposite())
-                    enemy_group = self._get_group(nx, ny)
-                    self.board = temp_board
+                    self.board[n] = enemy_value
+                    enemy_group = self._get_group(n)
 
                     if len(enemy_group) == 1:
                         # Check if placing enemy stone here would capture our stone
-                        self.set(nx, ny, color.opposite())
-                        our_group = self._get_group(x, y)
+                        our_group = self._get_group(idx)
                         if not self._has_liberties(our_group):
-                            self.ko_point = (nx, ny)
-                        self.set(nx, ny, Stone.EMPTY)
+                            self.ko_point = (n % self._stride, n // self._stride)
+                        self.board[n] = 0
                         break
+                    self.board[n] = 0
 
         # Record the move
         move = Move(x, y, color)
         self.move_history.append(move)
 
+        # Record a rewind keyframe every few moves
+        if len(self.move_history) % _KEYFRAME_INTERVAL == 0:
+            self._keyframes.append((len(self.move_history), bytes(self.board),
+                                    self.captured_black, self.captured_white,
+                                    self.ko_point))
+
         return True, ""
 
     def to_ascii(self, show_coords: bool = True, use_color: bool = True) -> str:
-        """Convert board to ASCII representation."""
+        """Convert board to ASCII representation.
+
+        Renders are memoized by position hash and display flags, so
+        rendering the same position twice (or into several sinks) only
+        builds the string once.
+        """
+        cache_key = (self._zobrist, self.captured_black, self.captured_white,
+                     len(self.move_history), self.ko_point,
+                     show_coords, use_color)
+        cached = self._ascii_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         lines = []
 
         # ANSI codes for dimming the dots
@@ -285,35 +628,42 @@ class GoBoard:
         else:
             DIM = RESET = ''
 
+        # Static coordinate frame, shared across boards of this size
+        if self.size not in _ASCII_FRAMES:
+            _ASCII_FRAMES[self.size] = _build_ascii_frame(self.size)
+        col_labels, row_prefixes, row_suffixes, row_bases = _ASCII_FRAMES[self.size]
+
         # Column labels
         if show_coords:
-            col_labels = "   " + " ".join(chr(ord('A') + i) if i < 8 else chr(ord('A') + i + 1)
-                                         for i in range(self.size))
             lines.append(col_labels)
 
-        # Board rows
-        for y in range(self.size):
-            row_num = self.size - y
+        # Cell glyphs: empty cells and star points are dimmed, stones are not
+        empty_char = f'{DIM}·{RESET} '
+        star_char = f'{DIM}+{RESET} '
+        stone_chars = {_BLACK: '○ ', _WHITE: '● '}
+
+        # Board rows, iterating the flat buffer a row at a time (top row of
+        # the display is the highest y on the board)
+        size = self.size
+        buf = self.board
+        star_mask = self._star_mask
+        for y in self._rng:
             row = []
 
             if show_coords:
-                row.append(f"{row_num:2} ")
-
-            for x in range(self.size):
-                stone = self.get(x, self.size - 1 - y)  # Flip Y for display
-
-                # Add special markers for star points (hoshi)
-                if stone == Stone.EMPTY:
-                    if self._is_star_point(x, self.size - 1 - y):
-                        row.append(f'{DIM}+{RESET}')
-                    else:
-                        row.append(f'{DIM}·{RESET}')
+                row.append(row_prefixes[y])
+
+            # Walk the row as paired slices instead of indexing per cell
+            base = row_bases[y]
+            end = base + size
+            for stone, star in zip(buf[base:end], star_mask[base:end]):
+                if stone == _EMPTY:
+                    row.append(star_char if star else empty_char)
                 else:
-                    row.append(str(stone))
-                row.append(' ')
+                    row.append(stone_chars[stone])
 
             if show_coords:
-                row.append(f"{row_num:2}")
+                row.append(row_suffixes[y])
 
             lines.append(''.join(row))
 
@@ -330,17 +680,15 @@ class GoBoard:
             ko_move = Move(self.ko_point[0], self.ko_point[1], Stone.EMPTY)
             lines.append(f"Ko at: {ko_move.to_human_coords()}")
 
-        return '\n'.join(lines)
+        rendered = '\n'.join(lines)
+        if len(self._ascii_cache) >= _ASCII_CACHE_LIMIT:
+            self._ascii_cache.pop(next(iter(self._ascii_cache)))
+        self._ascii_cache[cache_key] = rendered
+        return rendered
 
     def _is_star_point(self, x: int, y: int) -> bool:
         """Check if a position is a star point (hoshi)."""
-        star_points = {
-            9: [(2, 2), (6, 2), (4, 4), (2, 6), (6, 6)],
-            13: [(3, 3), (9, 3), (6, 6), (3, 9), (9, 9)],
-            19: [(3, 3), (9, 3), (15, 3), (3, 9), (9, 9), (15, 9),
-                 (3, 15), (9, 15), (15, 15)]
-        }
-        return (x, y) in star_points.get(self.size, [])
+        return (x, y) in self._star_set
 
     def undo_last_move(self) -> bool:
         """Remove the last move and restore the board state.
@@ -351,11 +699,28 @@ class GoBoard:
         if not self.move_history:
             return False
 
-        # Remove the last move
-        self.move_history.pop()
-
-        # Rebuild the board from scratch by replaying all remaining moves
-        # This ensures captures and ko state are correctly restored
+        # Remove the last move, and any keyframes recorded past it
+        last_move = self.move_history.pop()
+        while self._keyframes and self._keyframes[-1][0] > len(self.move_history):
+            self._keyframes.pop()
+
+        # A pass never touched the board, so there is nothing to restore
+        if last_move.x < 0 or last_move.y < 0:
+            return True
+
+        if self._history_states:
+            # Restore the snapshot taken just before the move was played
+            board_bytes, captured_black, captured_white, ko_point = \
+                self._history_states.pop()
+            self.board[:] = board_bytes
+            self.captured_black = captured_black
+            self.captured_white = captured_white
+            self.ko_point = ko_point
+            self._rebuild_groups()
+            return True
+
+        # No snapshot available (state loaded from disk, or the snapshot
+        # window was exceeded): rebuild by replaying the remaining moves
         temp_board = GoBoard(self.size)
 
         for move in self.move_history:
@@ -363,23 +728,85 @@ class GoBoard:
             if move.x >= 0 and move.y >= 0:
                 temp_board.place_stone(move.x, move.y, move.color)
 
-        # Copy the rebuilt state back
+        # Copy the rebuilt state back, adopting the replay's snapshots so
+        # further undos can restore instead of replaying again
         self.board = temp_board.board
         self.captured_black = temp_board.captured_black
         self.captured_white = temp_board.captured_white
         self.ko_point = temp_board.ko_point
+        self._parent = temp_board._parent
+        self._members = temp_board._members
+        self._liberties = temp_board._liberties
+        self._empties = temp_board._empties
+        self._zobrist = temp_board._zobrist
+        self._history_states = temp_board._history_states
 
         return True
 
+    def board_at_move(self, n: int) -> 'GoBoard':
+        """Reconstruct the position after the first `n` moves of this game.
+
+        Starts from the nearest keyframe at or before move `n` and replays
+        only the remaining moves, so rewinding a long game costs at most
+        one keyframe restore plus a handful of placements.
+        """
+        board = GoBoard(self.size)
+        start = 0
+        for index, board_bytes, captured_black, captured_white, ko_point \
+                in reversed(self._keyframes):
+            if index <= n:
+                board.board[:] = board_bytes
+                board.captured_black = captured_black
+                board.captured_white = captured_white
+                board.ko_point = ko_point
+                board._rebuild_groups()
+                start = index
+                break
+
+        for i in range(start, n):
+            move = self.move_history[i]
+            if move.x >= 0 and move.y >= 0:
+                board.place_stone(move.x, move.y, move.color)
+
+        # The reconstructed board carries the real history prefix (passes
+        # included); its replay-time keyframes are indexed against the
+        # compacted replay, so drop them
+        board.move_history = list(self.move_history[:n])
+        board._keyframes = []
+        return board
+
+    def compact_history(self) -> array.array:
+        """Get the move history as a signed-byte array of (x, y, color) triples.
+
+        Passes keep their (-1, -1) marker. Built on demand from
+        move_history, which remains the single source of truth (passes are
+        appended to it directly by callers).
+        """
+        compact = array.array('b')
+        for m in self.move_history:
+            compact.append(m.x)
+            compact.append(m.y)
+            compact.append(m.color.value)
+        return compact
+
     def save_to_dict(self) -> dict:
         """Save board state to a dictionary."""
         return {
             'size': self.size,
-            'board': [[stone.value for stone in row] for row in self.board],
+            # b64encode takes any bytes-like object, so the bytearray and
+            # the move array go in without an intermediate bytes copy
+            'board_b64': base64.b64encode(self.board).decode('ascii'),
             'captured_black': self.captured_black,
             'captured_white': self.captured_white,
-            'moves': [(m.x, m.y, m.color.value) for m in self.move_history],
-            'ko_point': self.ko_point
+            'moves_b64': base64.b64encode(
+                self.compact_history()).decode('ascii'),
+            'ko_point': self.ko_point,
+            'keyframes': [
+                [index, base64.b64encode(board_bytes).decode('ascii'),
+                 captured_black, captured_white, ko_point]
+                for index, board_bytes, captured_black, captured_white,
+                ko_point in self._keyframes
+            ]
         }
 
     @classmethod
@@ -387,14 +814,35 @@ class GoBoard:
         """Load board state from a dictionary."""
         board = cls(data['size'])
 
-        # Restore board state
-        for y in range(board.size):
-            for x in range(board.size):
-                board.board[y][x] = Stone(data['board'][y][x])
+        # Restore board state; the flat base64 form encodes the buffer
+        # directly, while older saves carry a nested list of rows
+        if 'board_b64' in data:
+            board.board[:] = base64.b64decode(data['board_b64'])
+        else:
+            stride = board._stride
+            for y in board._rng:
+                row = data['board'][y]
+                for x in board._rng:
+                    board.board[y * stride + x] = row[x]
 
         board.captured_black = data['captured_black']
         board.captured_white = data['captured_white']
-        board.move_history = [Move(x, y, Stone(color)) for x, y, color in data['moves']]
+        if 'moves_b64' in data:
+            triples = array.array('b')
+            triples.frombytes(base64.b64decode(data['moves_b64']))
+            board.move_history = [
+                Move(triples[i], triples[i + 1], Stone(triples[i + 2]))
+                for i in range(0, len(triples), 3)]
+        else:
+            board.move_history = [Move(x, y, Stone(color))
+                                  for x, y, color in data['moves']]
         board.ko_point = tuple(data['ko_point']) if data['ko_point'] else None
+        board._keyframes = [
+            (index, base64.b64decode(board_b64), captured_black,
+             captured_white, tuple(ko_point) if ko_point else None)
+            for index, board_b64, captured_black, captured_white, ko_point
+            in data.get('keyframes', [])
+        ]
+        board._rebuild_groups()
 
         return board
\ No newline at end of file
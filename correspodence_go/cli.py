@@ -1,46 +1,266 @@
 """Command-line interface for Correspodence Go."""
 
+import base64
 import json
 import os
 import sys
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import argparse
 
-from .board import GoBoard, Stone, Move
+try:
+    import orjson
+except ImportError:
+    # Optional accelerator: orjson parses and serializes JSON several times
+    # faster than the stdlib, which matters for commands that touch many
+    # game files. Everything works without it.
+    orjson = None
 
 
 DEFAULT_GAME_DIR = Path.home() / '.correspodence-go' / 'games'
 
+# Summary cache for `list`, keyed by game name and file identity
+# (mtime_ns, size), so repeated listings only stat unchanged files.
+LIST_CACHE_PATH = Path.home() / '.correspodence-go' / '.list-cache.json'
+
+# Rewound-position cache for `show --move`, keyed by game name, file
+# mtime and move index. Entries are kept in recency order and evicted
+# LRU-first past the limit.
+REWIND_CACHE_PATH = Path.home() / '.correspodence-go' / '.rewind-cache.json'
+_REWIND_CACHE_LIMIT = 64
+
+# A move append rewrites the full snapshot only once the side log grows
+# this long; in between, each move costs one small appended line.
+_LOG_SNAPSHOT_INTERVAL = 32
+
+
+def _import_board() -> None:
+    """Bind the board types into module globals on first use.
+
+    Importing ``.board`` pays for enum, dataclass and lookup-table setup;
+    commands that never touch a board (list, delete) skip it entirely.
+    """
+    global GoBoard, Stone, Move, _STONE_BY_NAME, _COLOR_NAMES
+    if 'GoBoard' not in globals():
+        from .board import GoBoard, Stone, Move
+        # Display/parse tables so hot paths skip enum .name lookups and
+        # string comparisons
+        _STONE_BY_NAME = {'black': Stone.BLACK, 'white': Stone.WHITE}
+        _COLOR_NAMES = {Stone.BLACK: 'BLACK', Stone.WHITE: 'WHITE'}
+
 
 def get_game_path(game_name: str) -> Path:
     """Get the path to a game file."""
     return DEFAULT_GAME_DIR / f"{game_name}.json"
 
 
-def load_game(game_name: str) -> Optional[GoBoard]:
+def get_log_path(game_name: str) -> Path:
+    """Get the path to a game's append-only move log."""
+    return DEFAULT_GAME_DIR / f"{game_name}.log"
+
+
+def _read_json(path: Path) -> dict:
+    """Parse a JSON file, using orjson when available."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_game(game_name: str) -> Optional['GoBoard']:
     """Load a game from disk."""
     game_path = get_game_path(game_name)
     if not game_path.exists():
         return None
 
-    with open(game_path, 'r') as f:
-        data = json.load(f)
+    _import_board()
+    board = GoBoard.load_from_dict(_read_json(game_path))
+
+    # Replay any moves appended to the side log since the last snapshot,
+    # using each entry's recorded color (parity only for pre-color logs)
+    log_path = get_log_path(game_name)
+    if log_path.exists():
+        for line in log_path.read_bytes().splitlines():
+            if not line:
+                continue
+            entry = json.loads(line)
+            if 'c' in entry:
+                color = Stone(entry['c'])
+            else:
+                color = board.next_color
+            if entry['x'] == -1 and entry['y'] == -1:
+                board.move_history.append(Move(-1, -1, color))
+            else:
+                success, error_msg = board.place_stone(entry['x'], entry['y'],
+                                                       color)
+                if not success:
+                    raise ValueError(
+                        f"Corrupt move log for game '{game_name}': "
+                        f"{error_msg}")
+
+    return board
+
+
+def peek_game(game_name: str) -> Optional[Tuple[int, int]]:
+    """Read just (board size, move count) from a saved game.
+
+    Skips GoBoard construction entirely for callers that only need the
+    summary fields, such as the game listing.
+    """
+    game_path = get_game_path(game_name)
+    if not game_path.exists():
+        return None
+
+    data = _read_json(game_path)
+    if 'moves_b64' in data:
+        move_count = len(base64.b64decode(data['moves_b64'])) // 3
+    else:
+        move_count = len(data['moves'])
+
+    # Moves appended to the side log since the last snapshot, one per line
+    try:
+        move_count += get_log_path(game_name).read_bytes().count(b'\n')
+    except OSError:
+        pass
+
+    return data['size'], move_count
+
+
+def load_move_history(game_name: str) -> Optional[list]:
+    """Read just the (x, y) move list from a saved game.
+
+    Decodes the packed history from the snapshot and appends any side-log
+    entries without constructing a GoBoard, for commands that only format
+    moves. Passes keep their (-1, -1) marker; colors follow from parity.
+    """
+    game_path = get_game_path(game_name)
+    if not game_path.exists():
+        return None
+
+    data = _read_json(game_path)
+    if 'moves_b64' in data:
+        raw = base64.b64decode(data['moves_b64'])
+        # Signed-byte (x, y, color) triples; only the coordinates matter here
+        moves = [((raw[i] + 128) % 256 - 128, (raw[i + 1] + 128) % 256 - 128)
+                 for i in range(0, len(raw), 3)]
+    else:
+        moves = [(x, y) for x, y, _ in data['moves']]
+
+    try:
+        log_bytes = get_log_path(game_name).read_bytes()
+    except OSError:
+        log_bytes = b''
+    for line in log_bytes.splitlines():
+        if line:
+            entry = json.loads(line)
+            moves.append((entry['x'], entry['y']))
+
+    return moves
+
+
+# Human column letters skip 'I'; mirrors Move.to_human_coords without
+# needing the board module.
+_HUMAN_COLS = 'ABCDEFGHJKLMNOPQRST'
+
 
-    return GoBoard.load_from_dict(data)
+def _xy_to_human(x: int, y: int) -> str:
+    """Format board coordinates as human notation, e.g. (3, 3) -> 'D4'."""
+    return f"{_HUMAN_COLS[x]}{y + 1}"
 
 
-def save_game(game_name: str, board: GoBoard) -> None:
-    """Save a game to disk."""
+def save_game(game_name: str, board: 'GoBoard', appended: Optional[int] = None) -> None:
+    """Save a game to disk.
+
+    When ``appended`` is given, the game only grew by that many moves
+    since it was loaded, so they are appended to the side log instead of
+    rewriting the whole snapshot — one ~30-byte write per move. Once the
+    log reaches _LOG_SNAPSHOT_INTERVAL entries (or for any non-append
+    change, such as an undo), the full snapshot is rewritten and the log
+    truncated.
+
+    The snapshot is written to a tempfile in the game directory and moved
+    into place with os.replace, so a crash mid-write can never leave a
+    truncated game file behind.
+    """
     DEFAULT_GAME_DIR.mkdir(parents=True, exist_ok=True)
     game_path = get_game_path(game_name)
+    log_path = get_log_path(game_name)
+
+    if appended is not None and appended > 0:
+        try:
+            log_lines = log_path.read_bytes().count(b'\n')
+        except OSError:
+            log_lines = 0
+        if log_lines + appended < _LOG_SNAPSHOT_INTERVAL:
+            lines = bytearray()
+            for move in board.move_history[-appended:]:
+                # The color is recorded too: moves made out of turn with
+                # -c must not be recolored by parity on replay
+                lines += json.dumps({'x': move.x, 'y': move.y,
+                                     'c': move.color.value}).encode('ascii')
+                lines += b'\n'
+            with open(log_path, 'ab') as f:
+                f.write(lines)
+            return
+
+    if orjson is not None:
+        payload = orjson.dumps(board.save_to_dict())
+    else:
+        payload = json.dumps(board.save_to_dict()).encode('utf-8')
+
+    fd, tmp_path = tempfile.mkstemp(dir=DEFAULT_GAME_DIR,
+                                    prefix=f'.{game_name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, game_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # The snapshot now holds the whole game; drop any replayed log
+    try:
+        os.unlink(log_path)
+    except OSError:
+        pass
+
+
+class GameSession:
+    """Load a game once, mutate it in memory, and save once on exit.
+
+    Commands that apply several mutations (e.g. a batch of moves) mark the
+    session dirty and get a single write when the block completes. Nothing
+    is saved if the block exits with an error, so a failed batch leaves the
+    game file untouched.
+    """
+
+    def __init__(self, game_name: str):
+        self.game_name = game_name
+        self.board: Optional['GoBoard'] = None
+        self.dirty = False
+        self._loaded_moves = 0
 
-    with open(game_path, 'w') as f:
-        json.dump(board.save_to_dict(), f, indent=2)
+    def __enter__(self) -> 'GameSession':
+        self.board = load_game(self.game_name)
+        if self.board is not None:
+            self._loaded_moves = len(self.board.move_history)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None and self.dirty and self.board is not None:
+            appended = len(self.board.move_history) - self._loaded_moves
+            save_game(self.game_name, self.board,
+                      appended=appended if appended > 0 else None)
+        return False
 
 
 def cmd_new(args: argparse.Namespace) -> None:
     """Create a new game."""
+    _import_board()
     if load_game(args.name):
         print(f"Error: Game '{args.name}' already exists.", file=sys.stderr)
         sys.exit(1)
@@ -50,6 +270,66 @@ def cmd_new(args: argparse.Namespace) -> None:
     print(f"Created new {args.size}x{args.size} game: {args.name}")
 
 
+def _load_rewind_cache() -> dict:
+    """Read the rewind cache, treating any problem as an empty cache."""
+    try:
+        return _read_json(REWIND_CACHE_PATH)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_rewind_cache(cache: dict) -> None:
+    """Write the rewind cache; failures are not worth surfacing."""
+    try:
+        if orjson is not None:
+            REWIND_CACHE_PATH.write_bytes(orjson.dumps(cache))
+        else:
+            REWIND_CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass
+
+
+def _board_at_move_cached(game_name: str, board: 'GoBoard', move_idx: int) -> 'GoBoard':
+    """Rewind ``board`` to ``move_idx``, caching the position on disk.
+
+    Repeated ``show --move`` invocations on an unchanged game file hit
+    the cache and skip the replay entirely; any edit to the game bumps
+    its mtime and invalidates the stale entries.
+    """
+    try:
+        st = get_game_path(game_name).stat()
+        key = f"{game_name}:{st.st_mtime_ns}:{move_idx}"
+    except OSError:
+        return board.board_at_move(move_idx)
+
+    cache = _load_rewind_cache()
+    entry = cache.pop(key, None)
+    if entry is not None:
+        rewound = GoBoard(board.size)
+        rewound.board = bytearray(base64.b64decode(entry['board_b64']))
+        rewound.captured_black = entry['captured_black']
+        rewound.captured_white = entry['captured_white']
+        ko = entry['ko_point']
+        rewound.ko_point = tuple(ko) if ko else None
+        rewound.move_history = board.move_history[:move_idx]
+        rewound._rebuild_groups()
+    else:
+        rewound = board.board_at_move(move_idx)
+        entry = {
+            'board_b64': base64.b64encode(rewound.board).decode('ascii'),
+            'captured_black': rewound.captured_black,
+            'captured_white': rewound.captured_white,
+            'ko_point': rewound.ko_point,
+        }
+
+    # Re-inserting the key keeps the dict in recency order for eviction
+    cache[key] = entry
+    while len(cache) > _REWIND_CACHE_LIMIT:
+        cache.pop(next(iter(cache)))
+    _save_rewind_cache(cache)
+    return rewound
+
+
 def cmd_show(args: argparse.Namespace) -> None:
     """Show the current board state."""
     board = load_game(args.name)
@@ -63,70 +343,88 @@ def cmd_show(args: argparse.Namespace) -> None:
             print(f"Error: Move {args.move} out of range (0-{len(board.move_history)})", file=sys.stderr)
             sys.exit(1)
 
-        # Create a fresh board and replay moves up to the specified point
-        temp_board = GoBoard(board.size)
-        for i in range(args.move):
-            move = board.move_history[i]
-            if move.x >= 0 and move.y >= 0:  # Skip passes
-                temp_board.place_stone(move.x, move.y, move.color)
-        board = temp_board
+        # Reconstruct from the nearest saved keyframe, or grab the cached
+        # position if this exact rewind was done before
+        board = _board_at_move_cached(args.name, board, args.move)
         print(f"\nGame: {args.name} (at move {args.move})")
     else:
         print(f"\nGame: {args.name}")
 
     print("-" * 40)
 
-    use_color = not getattr(args, 'no_color', False)
+    use_color = not args.no_color
     print(board.to_ascii(show_coords=not args.no_coords, use_color=use_color))
 
 
 def cmd_move(args: argparse.Namespace) -> None:
-    """Make a move in the game."""
-    board = load_game(args.name)
-    if not board:
-        print(f"Error: Game '{args.name}' not found.", file=sys.stderr)
-        sys.exit(1)
+    """Make one or more moves in the game."""
+    _import_board()
+    with GameSession(args.name) as session:
+        board = session.board
+        if not board:
+            print(f"Error: Game '{args.name}' not found.", file=sys.stderr)
+            sys.exit(1)
 
-    # Determine whose turn it is
-    if args.color:
-        color = Stone.BLACK if args.color.lower() == 'black' else Stone.WHITE
-    else:
-        # Auto-detect based on move count
-        if len(board.move_history) % 2 == 0:
-            color = Stone.BLACK
+        # Determine whose turn it is
+        if args.color:
+            color = _STONE_BY_NAME[args.color.lower()]
         else:
-            color = Stone.WHITE
+            # Auto-detect based on move count
+            color = board.next_color
+
+        # Apply every position, alternating colors; the session writes one
+        # save at the end, and nothing at all if any move is rejected
+        for position in args.positions:
+            # Handle pass
+            if position.lower() == 'pass':
+                # Record pass in move history (using invalid coordinates as marker)
+                pass_move = Move(-1, -1, color)
+                board.move_history.append(pass_move)
+                print(f"{_COLOR_NAMES[color]} passes.")
+            else:
+                # Parse the move
+                try:
+                    move = Move.from_human_coords(position, color)
+                except ValueError as e:
+                    print(f"Error: Invalid move format: {e}", file=sys.stderr)
+                    sys.exit(1)
+
+                # Make the move
+                success, error_msg = board.place_stone(move.x, move.y, color)
+                if not success:
+                    print(f"Error: Invalid move at {position} - {error_msg}",
+                          file=sys.stderr)
+                    sys.exit(1)
+
+                print(f"{_COLOR_NAMES[color]} plays at {position}")
+
+            session.dirty = True
+            color = color.opposite()
 
-    # Handle pass
-    if args.position.lower() == 'pass':
-        # Record pass in move history (using invalid coordinates as marker)
-        pass_move = Move(-1, -1, color)
-        board.move_history.append(pass_move)
-        save_game(args.name, board)
-        print(f"{color.name} passes.")
-        return
+        # Show board if requested
+        if args.show:
+            print()
+            use_color = not args.no_color
+            print(board.to_ascii(use_color=use_color))
 
-    # Parse the move
-    try:
-        move = Move.from_human_coords(args.position, color)
-    except ValueError as e:
-        print(f"Error: Invalid move format: {e}", file=sys.stderr)
-        sys.exit(1)
 
-    # Make the move
-    success, error_msg = board.place_stone(move.x, move.y, color)
-    if not success:
-        print(f"Error: Invalid move at {args.position} - {error_msg}", file=sys.stderr)
-        sys.exit(1)
+def _load_list_cache() -> dict:
+    """Read the list summary cache, treating any problem as an empty cache."""
+    try:
+        return _read_json(LIST_CACHE_PATH)
+    except (OSError, ValueError):
+        return {}
 
-    save_game(args.name, board)
-    print(f"{color.name} plays at {args.position}")
 
-    # Show board if requested
-    if args.show:
-        print()
-        use_color = not getattr(args, 'no_color', False)
-        print(board.to_ascii(use_color=use_color))
+def _save_list_cache(cache: dict) -> None:
+    """Write the list summary cache; failures are not worth surfacing."""
+    try:
+        if orjson is not None:
+            LIST_CACHE_PATH.write_bytes(orjson.dumps(cache))
+        else:
+            LIST_CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass
 
 
 def cmd_list(args: argparse.Namespace) -> None:
@@ -135,23 +433,50 @@ def cmd_list(args: argparse.Namespace) -> None:
         print("No games found.")
         return
 
-    games = list(DEFAULT_GAME_DIR.glob("*.json"))
+    # One getdents pass instead of glob's Path construction; DirEntry
+    # caches the stat result the cache check needs anyway
+    with os.scandir(DEFAULT_GAME_DIR) as it:
+        games = [e for e in it if e.name.endswith('.json')]
     if not games:
         print("No games found.")
         return
 
+    cache = _load_list_cache()
+    cache_dirty = False
+
     print("Available games:")
-    for game_path in sorted(games):
-        game_name = game_path.stem
+    games.sort(key=lambda e: e.name)
+    for game_entry in games:
+        game_name = game_entry.name[:-len('.json')]
         try:
-            board = load_game(game_name)
-            if board:
-                next_player = "BLACK" if len(board.move_history) % 2 == 0 else "WHITE"
-                print(f"  {game_name:20} - {board.size}x{board.size} board, "
-                      f"{len(board.move_history)} moves, {next_player} to play")
+            st = game_entry.stat()
+            try:
+                log_size = get_log_path(game_name).stat().st_size
+            except OSError:
+                log_size = 0
+            entry = cache.get(game_name)
+            if (entry is None or entry['mtime_ns'] != st.st_mtime_ns
+                    or entry['size'] != st.st_size
+                    or entry.get('log_size', 0) != log_size):
+                summary = peek_game(game_name)
+                if summary is None:
+                    continue
+                board_size, move_count = summary
+                entry = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                         'log_size': log_size,
+                         'board_size': board_size, 'move_count': move_count}
+                cache[game_name] = entry
+                cache_dirty = True
+
+            next_player = "BLACK" if entry['move_count'] % 2 == 0 else "WHITE"
+            print(f"  {game_name:20} - {entry['board_size']}x{entry['board_size']} board, "
+                  f"{entry['move_count']} moves, {next_player} to play")
         except Exception as e:
             print(f"  {game_name:20} - (error loading: {e})")
 
+    if cache_dirty:
+        _save_list_cache(cache)
+
 
 def cmd_delete(args: argparse.Namespace) -> None:
     """Delete a game."""
@@ -167,56 +492,56 @@ def cmd_delete(args: argparse.Namespace) -> None:
             return
 
     game_path.unlink()
+    try:
+        get_log_path(args.name).unlink()
+    except OSError:
+        pass
     print(f"Deleted game: {args.name}")
 
 
 def cmd_history(args: argparse.Namespace) -> None:
     """Show game move history."""
-    board = load_game(args.name)
-    if not board:
+    moves = load_move_history(args.name)
+    if moves is None:
         print(f"Error: Game '{args.name}' not found.", file=sys.stderr)
         sys.exit(1)
 
-    if not board.move_history:
+    if not moves:
         print("No moves played yet.")
         return
 
-    print(f"Move history for game '{args.name}':")
-    print("-" * 40)
-
-    for i, move in enumerate(board.move_history):
+    # Build the whole listing and write it once instead of a print per move
+    lines = [f"Move history for game '{args.name}':", "-" * 40]
+    for i, (x, y) in enumerate(moves):
         move_num = i + 1
         color = "Black" if i % 2 == 0 else "White"
 
-        if move.x == -1 and move.y == -1:
-            print(f"{move_num:3}. {color:5} passes")
+        if x == -1 and y == -1:
+            lines.append(f"{move_num:3}. {color:5} passes")
         else:
-            coords = move.to_human_coords()
-            print(f"{move_num:3}. {color:5} {coords}")
+            lines.append(f"{move_num:3}. {color:5} {_xy_to_human(x, y)}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_moves(args: argparse.Namespace) -> None:
     """Print all moves in order (compact format)."""
-    board = load_game(args.name)
-    if not board:
+    moves = load_move_history(args.name)
+    if moves is None:
         print(f"Error: Game '{args.name}' not found.", file=sys.stderr)
         sys.exit(1)
 
-    if not board.move_history:
+    if not moves:
         print("No moves played yet.")
         return
 
-    moves_list = []
-    for i, move in enumerate(board.move_history):
-        if move.x == -1 and move.y == -1:
-            moves_list.append("pass")
-        else:
-            moves_list.append(move.to_human_coords())
+    moves_list = ["pass" if x == -1 and y == -1 else _xy_to_human(x, y)
+                  for x, y in moves]
 
-    # Print moves in a compact format
+    # Print moves in a compact format, one write either way
     if args.one_per_line:
-        for i, move_str in enumerate(moves_list):
-            print(f"{i+1}. {move_str}")
+        sys.stdout.write("\n".join(f"{i+1}. {move_str}"
+                                   for i, move_str in enumerate(moves_list)) + "\n")
     else:
         print(" ".join(moves_list))
 
@@ -250,7 +575,7 @@ def cmd_undo(args: argparse.Namespace) -> None:
         # Show board if requested
         if args.show:
             print()
-            use_color = not getattr(args, 'no_color', False)
+            use_color = not args.no_color
             print(board.to_ascii(use_color=use_color))
     else:
         print(f"Error: Failed to undo move.", file=sys.stderr)
@@ -264,46 +589,38 @@ def cmd_export(args: argparse.Namespace) -> None:
         print(f"Error: Game '{args.name}' not found.", file=sys.stderr)
         sys.exit(1)
 
-    # Build SGF string
-    sgf_lines = [
-        "(;",
-        f"GM[1]",  # Game type: Go
-        f"FF[4]",  # File format version
-        f"SZ[{board.size}]",  # Board size
-        f"AP[Correspodence-Go:0.1.0]",  # Application
-        f"PW[White]",  # White player name
-        f"PB[Black]",  # Black player name
-    ]
-
-    # Add moves
+    # Build the SGF payload as bytes, one buffer for the whole game
+    sgf = bytearray()
+    sgf += b"(;\n"
+    sgf += b"GM[1]\n"   # Game type: Go
+    sgf += b"FF[4]\n"   # File format version
+    sgf += f"SZ[{board.size}]\n".encode('ascii')  # Board size
+    sgf += b"AP[Correspodence-Go:0.1.0]\n"  # Application
+    sgf += b"PW[White]\n"  # White player name
+    sgf += b"PB[Black]\n"  # Black player name
+
+    # Add moves; colors follow parity, so index a pair instead of branching
+    bw = (b"B", b"W")
     for i, move in enumerate(board.move_history):
-        color = "B" if i % 2 == 0 else "W"
+        color = bw[i & 1]
         if move.x == -1 and move.y == -1:
-            sgf_lines.append(f";{color}[]")  # Pass
+            sgf += b";" + color + b"[]\n"  # Pass
         else:
-            coords = move.to_sgf_coords(board.size)
-            sgf_lines.append(f";{color}[{coords}]")
+            coords = move.to_sgf_coords(board.size).encode('ascii')
+            sgf += b";" + color + b"[" + coords + b"]\n"
 
-    sgf_lines.append(")")
-    sgf_content = "\n".join(sgf_lines)
+    sgf += b")"
 
     if args.output:
-        with open(args.output, 'w') as f:
-            f.write(sgf_content)
+        with open(args.output, 'wb') as f:
+            f.write(sgf)
         print(f"Exported game to: {args.output}")
     else:
-        print(sgf_content)
-
+        sys.stdout.buffer.write(sgf + b"\n")
+        sys.stdout.buffer.flush()
 
-def main():
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        prog='corr-go',
-        description='Command-line Go game manager'
-    )
-    subparsers = parser.add_subparsers(dest='command', help='Commands')
 
-    # New game command
+def _add_new_parser(subparsers) -> None:
     new_parser = subparsers.add_parser('new', help='Create a new game')
     new_parser.add_argument('name', help='Name for the game')
     new_parser.add_argument(
@@ -314,7 +631,8 @@ def main():
         help='Board size (default: 19)'
     )
 
-    # Show board command
+
+def _add_show_parser(subparsers) -> None:
     show_parser = subparsers.add_parser('show', help='Show the current board')
     show_parser.add_argument('name', help='Game name')
     show_parser.add_argument(
@@ -333,12 +651,16 @@ def main():
         help='Show board at a specific move number (0 for empty board)'
     )
 
-    # Move command
+
+def _add_move_parser(subparsers) -> None:
     move_parser = subparsers.add_parser('move', help='Make a move')
     move_parser.add_argument('name', help='Game name')
     move_parser.add_argument(
-        'position',
-        help='Position (e.g., D4, K10) or "pass"'
+        'positions',
+        nargs='+',
+        metavar='position',
+        help='One or more positions (e.g., D4, K10) or "pass"; '
+             'colors alternate across a batch'
     )
     move_parser.add_argument(
         '-c', '--color',
@@ -356,10 +678,12 @@ def main():
         help='Disable dimmed dots (for terminals without ANSI support)'
     )
 
-    # List games command
-    list_parser = subparsers.add_parser('list', help='List all games')
 
-    # Delete game command
+def _add_list_parser(subparsers) -> None:
+    subparsers.add_parser('list', help='List all games')
+
+
+def _add_delete_parser(subparsers) -> None:
     delete_parser = subparsers.add_parser('delete', help='Delete a game')
     delete_parser.add_argument('name', help='Game name')
     delete_parser.add_argument(
@@ -368,11 +692,13 @@ def main():
         help='Skip confirmation'
     )
 
-    # History command
+
+def _add_history_parser(subparsers) -> None:
     history_parser = subparsers.add_parser('history', help='Show move history')
     history_parser.add_argument('name', help='Game name')
 
-    # Moves command
+
+def _add_moves_parser(subparsers) -> None:
     moves_parser = subparsers.add_parser('moves', help='Print all moves in order')
     moves_parser.add_argument('name', help='Game name')
     moves_parser.add_argument(
@@ -381,7 +707,8 @@ def main():
         help='Print one move per line with numbers'
     )
 
-    # Undo command
+
+def _add_undo_parser(subparsers) -> None:
     undo_parser = subparsers.add_parser('undo', help='Undo the last move')
     undo_parser.add_argument('name', help='Game name')
     undo_parser.add_argument(
@@ -395,7 +722,8 @@ def main():
         help='Disable dimmed dots (for terminals without ANSI support)'
     )
 
-    # Export command
+
+def _add_export_parser(subparsers) -> None:
     export_parser = subparsers.add_parser('export', help='Export game to SGF')
     export_parser.add_argument('name', help='Game name')
     export_parser.add_argument(
@@ -403,27 +731,56 @@ def main():
         help='Output file (prints to stdout if not specified)'
     )
 
-    # Parse arguments
+
+# Command name -> (subparser builder, handler); insertion order is the
+# order commands appear in --help.
+COMMANDS = {
+    'new': (_add_new_parser, cmd_new),
+    'show': (_add_show_parser, cmd_show),
+    'move': (_add_move_parser, cmd_move),
+    'list': (_add_list_parser, cmd_list),
+    'delete': (_add_delete_parser, cmd_delete),
+    'history': (_add_history_parser, cmd_history),
+    'moves': (_add_moves_parser, cmd_moves),
+    'undo': (_add_undo_parser, cmd_undo),
+    'export': (_add_export_parser, cmd_export),
+}
+
+
+def build_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    When ``only`` names a known command, just that subparser is built;
+    main() uses this so a normal invocation skips constructing the other
+    eight subparsers.
+    """
+    parser = argparse.ArgumentParser(
+        prog='corr-go',
+        description='Command-line Go game manager'
+    )
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+
+    for name, (add_subparser, _) in COMMANDS.items():
+        if only is None or name == only:
+            add_subparser(subparsers)
+
+    return parser
+
+
+def main():
+    """Main entry point."""
+    # Peek at the command word so only its subparser has to be built;
+    # anything else (no args, --help, an unknown command) gets the full
+    # parser and behaves exactly as before.
+    head = sys.argv[1] if len(sys.argv) > 1 else None
+    parser = build_parser(head if head in COMMANDS else None)
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    # Execute command
-    commands = {
-        'new': cmd_new,
-        'show': cmd_show,
-        'move': cmd_move,
-        'list': cmd_list,
-        'delete': cmd_delete,
-        'history': cmd_history,
-        'moves': cmd_moves,
-        'undo': cmd_undo,
-        'export': cmd_export,
-    }
-
-    commands[args.command](args)
+    COMMANDS[args.command][1](args)
 
 
 if __name__ == '__main__':